@@ -4,6 +4,7 @@ Enhanced Thomson Reuters IT Helpdesk MCP Client (Gateway Version)
 Beautiful, informative interface with proper error handling and user experience
 """
 
+import itertools
 import json
 import requests
 import uuid
@@ -13,21 +14,60 @@ import argparse
 import sys
 import textwrap
 import os
+import time
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import boto3
 
+# Shared HTTP session so consecutive gateway calls reuse the same TLS connection.
+# Only throttling and unavailable responses are retried; read timeouts are not,
+# since a tools/call may already be running, and once retries are exhausted the
+# last response is returned so the gateway's own error is still reported
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=2,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=(429, 503),
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False
+    )
+))
+
+# Map simple tool names to gateway prefixed names (based on actual gateway tools list)
+GATEWAY_TOOL_NAMES = {
+    "enhanced_search_it_support": "target-lambda-it-helpdesk-enhanced-mcp___it_support_search",
+    "it_support_search": "target-lambda-it-helpdesk-enhanced-mcp___it_support_search",
+    "reset_password": "target-lambda-it-helpdesk-enhanced-mcp___reset_password",
+    "aws_access": "target-lambda-it-helpdesk-enhanced-mcp___aws_access",
+    # Map enhanced_ai_response to the main IT support tool
+    "enhanced_ai_response": "target-lambda-it-helpdesk-enhanced-mcp___it_support_search"
+}
+
 class MCPGatewayClient:
     """Model Context Protocol client for Thomson Reuters IT Helpdesk via AgentCore Gateway"""
     
-    def __init__(self, gateway_url: str = "https://a208194-askjulius-agentcore-gateway-mcp-iam-fvro4phd59.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp", region: str = "us-east-1"):
+    def __init__(self, gateway_url: str = "https://a208194-askjulius-agentcore-gateway-mcp-iam-fvro4phd59.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp", region: str = "us-east-1", cache_ttl_seconds: int = 300):
         self.gateway_url = gateway_url
         self.region = region
         self.session_id = str(uuid.uuid4())
+        # Sequential JSON-RPC request ids scoped to this session
+        self._request_ids = itertools.count(1)
+        
+        # Gateway tool listings rarely change, so reuse them for a short window
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._tools_cache = None
         
         # Get AWS credentials for signing requests
         session = boto3.Session()
         self.credentials = session.get_credentials()
+        # One signer for the client lifetime; it reads refreshable credentials on each signature
+        self.signer = SigV4Auth(self.credentials, "bedrock-agentcore", self.region)
         
         # Color codes for beautiful terminal output
         self.COLORS = {
@@ -47,17 +87,17 @@ class MCPGatewayClient:
         print(f"{self.COLORS['INFO']}   🆔 Session ID: {self.session_id}{self.COLORS['RESET']}")
         print()
     
-    def _sign_request(self, method: str, url: str, headers: Dict[str, str], body: str) -> Dict[str, str]:
+    def _sign_request(self, method: str, url: str, headers: Dict[str, str], body: bytes) -> Dict[str, str]:
         """Sign HTTP request with AWS SigV4"""
         request = AWSRequest(method=method, url=url, data=body, headers=headers)
-        SigV4Auth(self.credentials, "bedrock-agentcore", self.region).add_auth(request)
+        self.signer.add_auth(request)
         return dict(request.headers)
     
     def invoke_gateway(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Invoke the AgentCore Gateway with MCP payload"""
         try:
-            # Prepare request
-            body = json.dumps(payload)
+            # Encode once; the same bytes are signed and sent
+            body = json.dumps(payload).encode('utf-8')
             headers = {
                 'Content-Type': 'application/json',
                 'Accept': 'application/json'
@@ -67,7 +107,7 @@ class MCPGatewayClient:
             signed_headers = self._sign_request('POST', self.gateway_url, headers, body)
             
             # Make HTTP request to gateway
-            response = requests.post(
+            response = HTTP_SESSION.post(
                 self.gateway_url,
                 data=body,
                 headers=signed_headers,
@@ -76,7 +116,7 @@ class MCPGatewayClient:
             
             # Parse response
             if response.status_code == 200:
-                return response.json()
+                return json.loads(response.content)
             else:
                 return {
                     "error": f"Gateway returned status {response.status_code}: {response.text}",
@@ -90,31 +130,32 @@ class MCPGatewayClient:
             }
     
     def list_tools(self) -> Dict[str, Any]:
-        """Get list of available MCP tools"""
+        """Get list of available MCP tools, served from cache while it is fresh"""
+        if self._tools_cache is not None:
+            cached_at, cached_response = self._tools_cache
+            if time.monotonic() - cached_at < self.cache_ttl_seconds:
+                print(f"{self.COLORS['INFO']}🔍 Using cached tools list...{self.COLORS['RESET']}")
+                return cached_response
+        
         payload = {
             "method": "tools/list",
             "params": {},
             "jsonrpc": "2.0",
-            "id": str(uuid.uuid4())
+            "id": f"{self.session_id}-{next(self._request_ids)}"
         }
         
         print(f"{self.COLORS['INFO']}🔍 Requesting tools list...{self.COLORS['RESET']}")
-        return self.invoke_gateway(payload)
+        response = self.invoke_gateway(payload)
+        
+        # Only cache successful listings so errors are retried on the next call
+        if "error" not in response:
+            self._tools_cache = (time.monotonic(), response)
+        return response
     
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a specific MCP tool"""
-        # Map simple tool names to gateway prefixed names (based on actual gateway tools list)
-        tool_name_map = {
-            "enhanced_search_it_support": "target-lambda-it-helpdesk-enhanced-mcp___it_support_search",
-            "it_support_search": "target-lambda-it-helpdesk-enhanced-mcp___it_support_search",
-            "reset_password": "target-lambda-it-helpdesk-enhanced-mcp___reset_password", 
-            "aws_access": "target-lambda-it-helpdesk-enhanced-mcp___aws_access",
-            # Map enhanced_ai_response to the main IT support tool
-            "enhanced_ai_response": "target-lambda-it-helpdesk-enhanced-mcp___it_support_search"
-        }
-        
         # Use mapped name if available, otherwise use original
-        actual_tool_name = tool_name_map.get(tool_name, tool_name)
+        actual_tool_name = GATEWAY_TOOL_NAMES.get(tool_name, tool_name)
         
         payload = {
             "method": "tools/call",
@@ -123,7 +164,7 @@ class MCPGatewayClient:
                 "arguments": arguments
             },
             "jsonrpc": "2.0",
-            "id": str(uuid.uuid4())
+            "id": f"{self.session_id}-{next(self._request_ids)}"
         }
         
         print(f"{self.COLORS['INFO']}🛠️  Calling tool: {tool_name}{self.COLORS['RESET']}")
@@ -253,7 +294,7 @@ class MCPGatewayClient:
         return '\n'.join(formatted_lines)
 
 
-def interactive_menu():
+def interactive_menu(client: Optional[MCPGatewayClient] = None):
     """Beautiful, informative interactive menu for testing MCP tools"""
     
     def clear_screen():
@@ -304,8 +345,9 @@ def interactive_menu():
         print(f"{colors['SUCCESS']}📞 Global Service Desk: +1-855-888-8899 | 🌐 ServiceNow: thomsonreuters.service-now.com{colors['RESET']}")
         print(f"{colors['BOLD']}{'─'*100}{colors['RESET']}")
     
-    # Initialize client
-    client = MCPGatewayClient()
+    # Initialize client unless the caller already configured one
+    if client is None:
+        client = MCPGatewayClient()
     
     while True:
         clear_screen()
@@ -400,6 +442,7 @@ if __name__ == "__main__":
     parser.add_argument("--args", "-a", help="Tool arguments as JSON string")
     parser.add_argument("--gateway-url", help="Custom gateway URL")
     parser.add_argument("--region", default="us-east-1", help="AWS region")
+    parser.add_argument("--no-cache", action="store_true", help="Always fetch a fresh tools list from the gateway")
     
     args = parser.parse_args()
     
@@ -409,11 +452,13 @@ if __name__ == "__main__":
         kwargs['gateway_url'] = args.gateway_url
     if args.region:
         kwargs['region'] = args.region
+    if args.no_cache:
+        kwargs['cache_ttl_seconds'] = 0
     
     client = MCPGatewayClient(**kwargs)
     
     if args.interactive:
-        interactive_menu()
+        interactive_menu(client)
     elif args.list_tools:
         response = client.list_tools()
         client.print_response(response, "Available MCP Tools")
@@ -423,4 +468,4 @@ if __name__ == "__main__":
         client.print_response(response, f"Tool: {args.tool}")
     else:
         # Default to interactive mode
-        interactive_menu()
\ No newline at end of file
+        interactive_menu(client)
\ No newline at end of file
@@ -1,7 +1,27 @@
 import json
-import uuid
+import logging
+import os
+import time
 import boto3
-from datetime import datetime
+from botocore.config import Config
+
+# Set LOG_LEVEL=DEBUG on the function to log each incoming event; an unknown
+# level name falls back to INFO rather than failing the function's init
+logger = logging.getLogger()
+try:
+    logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+except ValueError:
+    logger.setLevel(logging.INFO)
+
+# Created once per container during init and reused by warm invocations.
+# Timeouts and retries are sized so a slow model call still falls back to the
+# static response within the function's 60 second timeout.
+bedrock = boto3.client('bedrock-runtime', region_name='us-east-1', config=Config(
+    connect_timeout=5,
+    read_timeout=20,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 2}
+))
 
 # REAL Thomson Reuters IT Resources and Procedures
 TR_IT_RESOURCES = {
@@ -190,11 +210,21 @@ TR_IT_RESOURCES = {
     }
 }
 
+RESPONSE_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
+
+# Keyword groups used to route queries, built once at import instead of per request
+ACCESSIBILITY_KEYWORDS = tuple(TR_IT_RESOURCES["sharepoint_resources"]["digital_accessibility"]["keywords"])
+SERVICE_DESK_KEYWORDS = ("service desk", "help desk", "support", "ticket", "incident")
+PASSWORD_KEYWORDS = ("password", "reset", "login", "unlock", "locked")
+EMAIL_KEYWORDS = tuple(TR_IT_RESOURCES["password_reset"]["email_exchange"]["keywords"])
+VPN_KEYWORDS = tuple(TR_IT_RESOURCES["password_reset"]["vpn_access"]["keywords"])
+M_ACCOUNT_KEYWORDS = tuple(TR_IT_RESOURCES["m_account"]["keywords"])
+AWS_KEYWORDS = tuple(TR_IT_RESOURCES["aws_access"]["keywords"])
+DNS_KEYWORDS = tuple(TR_IT_RESOURCES["dns_issues"]["keywords"])
+
 def get_bedrock_ai_response(query: str, session_id: str) -> str:
     """Get AI-enhanced response from Amazon Bedrock with TR context"""
     try:
-        bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
-        
         prompt = f"""You are an expert IT helpdesk assistant specifically for Thomson Reuters employees. You have deep knowledge of Thomson Reuters IT infrastructure, policies, and procedures.
 
 Employee query: {query}
@@ -241,7 +271,7 @@ Keep response concise but comprehensive."""
         return response_body['content'][0]['text']
         
     except Exception as e:
-        print(f"Bedrock AI error: {str(e)}")
+        logger.error("Bedrock AI error: %s", e)
         return f"""I understand you need help with: {query}
 
 **Please contact Thomson Reuters Global Service Desk for immediate assistance:**
@@ -260,7 +290,7 @@ def process_it_request(query: str, session_id: str) -> str:
     query_lower = query.lower()
     
     # Check for SharePoint and accessibility queries
-    if any(keyword in query_lower for keyword in TR_IT_RESOURCES["sharepoint_resources"]["digital_accessibility"]["keywords"]):
+    if any(keyword in query_lower for keyword in ACCESSIBILITY_KEYWORDS):
         return f"""**🌐 Thomson Reuters SharePoint Resources**
 
 **Digital Accessibility Center of Excellence:**
@@ -290,7 +320,7 @@ def process_it_request(query: str, session_id: str) -> str:
 **📍 Source**: Official Thomson Reuters SharePoint Sites & Service Desk Portal"""
     
     # Check for service desk or support requests
-    elif any(keyword in query_lower for keyword in ["service desk", "help desk", "support", "ticket", "incident"]):
+    elif any(keyword in query_lower for keyword in SERVICE_DESK_KEYWORDS):
         return f"""**🎫 Thomson Reuters Service Desk Support Options**
 
 **Service Desk SharePoint Portal:**
@@ -321,14 +351,14 @@ def process_it_request(query: str, session_id: str) -> str:
 **📍 Source**: Official Thomson Reuters Service Desk SharePoint & ServiceNow Portal"""
 
     # Check for password reset requests
-    elif any(keyword in query_lower for keyword in ["password", "reset", "login", "unlock", "locked"]):
-        if any(keyword in query_lower for keyword in TR_IT_RESOURCES["password_reset"]["email_exchange"]["keywords"]):
+    elif any(keyword in query_lower for keyword in PASSWORD_KEYWORDS):
+        if any(keyword in query_lower for keyword in EMAIL_KEYWORDS):
             return f"""**📧 Email Password Reset**
 
 {TR_IT_RESOURCES['password_reset']['email_exchange']['process']}
 
 **📍 Source**: Official Thomson Reuters IT Procedures & Service Desk Documentation"""
-        elif any(keyword in query_lower for keyword in TR_IT_RESOURCES["password_reset"]["vpn_access"]["keywords"]):
+        elif any(keyword in query_lower for keyword in VPN_KEYWORDS):
             return f"""**🔒 VPN Password Reset**
 
 {TR_IT_RESOURCES['password_reset']['vpn_access']['process']}
@@ -338,7 +368,7 @@ def process_it_request(query: str, session_id: str) -> str:
             return f"**🔐 Windows Domain Password Reset**\n\n{TR_IT_RESOURCES['password_reset']['windows_domain']['process']}"
     
     # Check for M account queries
-    elif any(keyword in query_lower for keyword in TR_IT_RESOURCES["m_account"]["keywords"]):
+    elif any(keyword in query_lower for keyword in M_ACCOUNT_KEYWORDS):
         return f"""**👤 M Account Management**
 
 {TR_IT_RESOURCES['m_account']['process']}
@@ -346,7 +376,7 @@ def process_it_request(query: str, session_id: str) -> str:
 **📍 Source**: Official Thomson Reuters Identity Management Team & Password Vault Documentation"""
     
     # Check for AWS access queries  
-    elif any(keyword in query_lower for keyword in TR_IT_RESOURCES["aws_access"]["keywords"]):
+    elif any(keyword in query_lower for keyword in AWS_KEYWORDS):
         return f"""**☁️ AWS Access Guide**
 
 {TR_IT_RESOURCES['aws_access']['process']}
@@ -354,7 +384,7 @@ def process_it_request(query: str, session_id: str) -> str:
 **📍 Source**: Official Thomson Reuters Cloud Platform Team & AWS SSO Documentation"""
     
     # Check for DNS issues
-    elif any(keyword in query_lower for keyword in TR_IT_RESOURCES["dns_issues"]["keywords"]):
+    elif any(keyword in query_lower for keyword in DNS_KEYWORDS):
         return f"""**🌐 DNS Troubleshooting**
 
 {TR_IT_RESOURCES['dns_issues']['process']}
@@ -379,7 +409,9 @@ def lambda_handler(event, context):
     """Thomson Reuters IT Helpdesk with real procedures and AI enhancement"""
     
     try:
-        print(f"TR IT Helpdesk processing: {json.dumps(event)}")
+        # Serializing the full event is only worth it when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TR IT Helpdesk processing: %s", json.dumps(event))
         
         if isinstance(event, dict):
             # Handle different parameter formats from gateway
@@ -395,14 +427,17 @@ def lambda_handler(event, context):
                 else:
                     query = "general IT support help"
             
-            session_id = event.get('session_id', f'tr-{str(uuid.uuid4())[:8]}')
+            # Only generate a session id when the caller didn't send one
+            session_id = event.get('session_id')
+            if session_id is None:
+                session_id = f'tr-{os.urandom(4).hex()}'
             
             # Process the query
             response_text = process_it_request(query, session_id)
             
             # Add session information
             response_text += f"\n\n**Session**: {session_id}"
-            response_text += f"\n**Timestamp**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}"
+            response_text += f"\n**Timestamp**: {time.strftime(RESPONSE_TIMESTAMP_FORMAT, time.gmtime())}"
             response_text += f"\n**Thomson Reuters Global Service Desk**: +1-855-888-8899"
             
             return {
@@ -423,7 +458,7 @@ def lambda_handler(event, context):
             }
     
     except Exception as e:
-        print(f"TR IT Helpdesk error: {str(e)}")
+        logger.error("TR IT Helpdesk error: %s", e)
         return {
             "content": [{
                 "type": "text",
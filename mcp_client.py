@@ -4,6 +4,7 @@ Enhanced IT Helpdesk MCP Client
 Interacts with the a208194-it-helpdesk-enhanced-mcp-server Lambda function
 """
 
+import itertools
 import json
 import boto3
 import uuid
@@ -11,35 +12,116 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 import argparse
 import sys
+import threading
+from botocore.config import Config
+
+DEFAULT_FUNCTION_NAME = "a208194-it-helpdesk-enhanced-mcp-server"
+DEFAULT_REGION = "us-east-1"
+
+# boto3's default session is not thread-safe, so clients are built under a lock
+_lambda_clients: Dict[str, Any] = {}
+_lambda_clients_lock = threading.Lock()
+
+def get_lambda_client(region: str = DEFAULT_REGION):
+    """Return a shared Lambda client for the region, reusing pooled keep-alive connections"""
+    with _lambda_clients_lock:
+        client = _lambda_clients.get(region)
+        if client is None:
+            config = Config(
+                max_pool_connections=50,
+                tcp_keepalive=True,
+                retries={'mode': 'adaptive', 'max_attempts': 2}
+            )
+            client = boto3.client('lambda', region_name=region, config=config)
+            _lambda_clients[region] = client
+        return client
+
+def invoke_mcp(payload, function_name: str = DEFAULT_FUNCTION_NAME, region: str = DEFAULT_REGION) -> Dict[str, Any]:
+    """Invoke the MCP Lambda with a JSON-RPC payload (dict or pre-serialized bytes) and return the parsed response"""
+    if isinstance(payload, dict):
+        payload = json.dumps(payload)
+    response = get_lambda_client(region).invoke(
+        FunctionName=function_name,
+        InvocationType='RequestResponse',
+        Payload=payload
+    )
+    return json.loads(response['Payload'].read())
+
+# The main menu never changes, so it is rendered once at import
+MAIN_MENU = "\n".join([
+    "\n" + "="*60,
+    "🔧 THOMSON REUTERS IT HELPDESK - MAIN MENU",
+    "="*60,
+    "📞 QUICK SUPPORT:",
+    "   1️⃣  Quick Help & Search        🔍 Ask any IT question",
+    "",
+    "🔐 AUTHENTICATION & ACCESS:",
+    "   2️⃣  Password & Login Issues    🔑 Resets, TEN domain, M accounts",
+    "   3️⃣  Cloud & AWS Access        ☁️  Cloud tools, AWS accounts",
+    "",
+    "🌐 CONNECTIVITY & COMMUNICATION:",
+    "   4️⃣  Network & VPN Issues      🌐 VPN, connectivity, DNS",
+    "   5️⃣  Email & Outlook Support   📧 Outlook, Exchange, email issues",
+    "",
+    "💻 SOFTWARE & TOOLS:",
+    "   6️⃣  Software Installation     📦 Apps, licensing, installation",
+    "",
+    "🛠️  ADVANCED OPTIONS:",
+    "   7️⃣  Custom IT Query           💬 Ask anything (AI-enhanced)",
+    "   8️⃣  Session Information       📊 Memory, preferences, history",
+    "   9️⃣  Available Tools           🔧 List all MCP tools",
+    "",
+    "❓ Type 'help' for tips | 'q' to quit"
+])
 
 class MCPClient:
     """Model Context Protocol client for IT Helpdesk server"""
     
-    def __init__(self, function_name: str = "a208194-it-helpdesk-enhanced-mcp-server", region: str = "us-east-1"):
+    def __init__(self, function_name: str = DEFAULT_FUNCTION_NAME, region: str = DEFAULT_REGION):
         self.function_name = function_name
         self.region = region
-        self.lambda_client = boto3.client('lambda', region_name=region)
         self.session_id = str(uuid.uuid4())
+        # JSON-RPC ids derived from the session are cheaper than a uuid per request
+        # and make requests easy to trace back to this session
+        self._request_ids = itertools.count(1)
+        
+        # Background warm-up, started only by interactive_session
+        self._warm_up = None
+        
         print(f"🔗 MCP Client initialized")
         print(f"   Function: {self.function_name}")
         print(f"   Region: {self.region}")
         print(f"   Session ID: {self.session_id}")
         print()
     
+    def _start_warm_up(self):
+        """Warm the Lambda container in the background so the first request skips the cold start"""
+        # A daemon thread, so quitting never waits on a slow warm-up invoke
+        self._warm_up = threading.Thread(target=self._warm_up_lambda, daemon=True)
+        self._warm_up.start()
+    
+    def _warm_up_lambda(self):
+        """Send a tools/list request to start a Lambda container"""
+        # Failures are ignored here; the first real request reports them
+        try:
+            invoke_mcp(
+                {"method": "tools/list", "params": {}, "jsonrpc": "2.0", "id": "warm-up"},
+                self.function_name,
+                self.region
+            )
+        except Exception:
+            pass
+    
     def invoke_lambda(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Invoke the Lambda function with MCP payload"""
+        if self._warm_up is not None:
+            # Wait for the warm-up so this request reuses the warm container
+            # instead of starting a second one
+            self._warm_up.join()
+            self._warm_up = None
+        
         try:
-            response = self.lambda_client.invoke(
-                FunctionName=self.function_name,
-                InvocationType='RequestResponse',
-                Payload=json.dumps(payload)
-            )
-            
-            # Read and parse response
-            response_payload = response['Payload'].read()
-            result = json.loads(response_payload)
-            
-            return result
+            return invoke_mcp(payload, self.function_name, self.region)
             
         except Exception as e:
             return {
@@ -53,7 +135,7 @@ class MCPClient:
             "method": "tools/list",
             "params": {},
             "jsonrpc": "2.0",
-            "id": str(uuid.uuid4())
+            "id": f"{self.session_id}-{next(self._request_ids)}"
         }
         
         print("🔍 Requesting tools list...")
@@ -68,7 +150,7 @@ class MCPClient:
                 "arguments": arguments
             },
             "jsonrpc": "2.0",
-            "id": str(uuid.uuid4())
+            "id": f"{self.session_id}-{next(self._request_ids)}"
         }
         
         print(f"🛠️  Calling tool: {tool_name}")
@@ -110,6 +192,9 @@ class MCPClient:
         print(f"📋 Session ID: {self.session_id}")
         print("=" * 60)
         
+        # The cold start overlaps with the user reading the menu
+        self._start_warm_up()
+        
         while True:
             try:
                 self.show_main_menu()
@@ -153,29 +238,7 @@ class MCPClient:
     
     def show_main_menu(self):
         """Display the main menu with categories"""
-        print("\n" + "="*60)
-        print("🔧 THOMSON REUTERS IT HELPDESK - MAIN MENU")
-        print("="*60)
-        print("📞 QUICK SUPPORT:")
-        print("   1️⃣  Quick Help & Search        🔍 Ask any IT question")
-        print()
-        print("🔐 AUTHENTICATION & ACCESS:")
-        print("   2️⃣  Password & Login Issues    🔑 Resets, TEN domain, M accounts")
-        print("   3️⃣  Cloud & AWS Access        ☁️  Cloud tools, AWS accounts")
-        print()
-        print("🌐 CONNECTIVITY & COMMUNICATION:")
-        print("   4️⃣  Network & VPN Issues      🌐 VPN, connectivity, DNS")
-        print("   5️⃣  Email & Outlook Support   📧 Outlook, Exchange, email issues")
-        print()
-        print("💻 SOFTWARE & TOOLS:")
-        print("   6️⃣  Software Installation     📦 Apps, licensing, installation")
-        print()
-        print("🛠️  ADVANCED OPTIONS:")
-        print("   7️⃣  Custom IT Query           💬 Ask anything (AI-enhanced)")
-        print("   8️⃣  Session Information       📊 Memory, preferences, history")
-        print("   9️⃣  Available Tools           🔧 List all MCP tools")
-        print()
-        print("❓ Type 'help' for tips | 'q' to quit")
+        print(MAIN_MENU)
     
     def handle_quick_help(self):
         """Handle quick help and search"""
@@ -519,9 +582,9 @@ class MCPClient:
 
 def main():
     parser = argparse.ArgumentParser(description="Thomson Reuters IT Helpdesk - AI-Enhanced MCP Client")
-    parser.add_argument("--function", default="a208194-it-helpdesk-enhanced-mcp-server", 
+    parser.add_argument("--function", default=DEFAULT_FUNCTION_NAME, 
                        help="Lambda function name")
-    parser.add_argument("--region", default="us-east-1", 
+    parser.add_argument("--region", default=DEFAULT_REGION, 
                        help="AWS region")
     parser.add_argument("--interactive", "-i", action="store_true", default=True,
                        help="Start interactive session (default)")
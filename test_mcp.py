@@ -4,68 +4,63 @@ Quick MCP Test Script
 Tests basic connectivity to the Enhanced IT Helpdesk MCP server
 """
 
+import argparse
 import json
-import boto3
+from concurrent.futures import ThreadPoolExecutor
+from mcp_client import invoke_mcp
 
-def test_mcp_connection():
+# The test payloads never change, so they are serialized once at import
+
+# Test 1: Tools List
+TOOLS_LIST_PAYLOAD = json.dumps({
+    "method": "tools/list",
+    "params": {},
+    "jsonrpc": "2.0",
+    "id": "test-1"
+}).encode('utf-8')
+
+# Test 2: Enhanced AI Response
+AI_RESPONSE_PAYLOAD = json.dumps({
+    "method": "tools/call",
+    "params": {
+        "name": "enhanced_ai_response",
+        "arguments": {
+            "question": "How do I reset my Thomson Reuters password?",
+            "session_id": "test-session-123"
+        }
+    },
+    "jsonrpc": "2.0",
+    "id": "test-2"
+}).encode('utf-8')
+
+def test_mcp_connection(verbose=False):
     """Test basic MCP connection"""
     print("🧪 Testing MCP Server Connection")
     print("=" * 40)
     
-    # Initialize Lambda client
-    lambda_client = boto3.client('lambda', region_name='us-east-1')
-    function_name = "a208194-it-helpdesk-enhanced-mcp-server"
+    # Both requests are independent, so overlap their round-trips
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tools_list = executor.submit(invoke_mcp, TOOLS_LIST_PAYLOAD)
+        ai_response = executor.submit(invoke_mcp, AI_RESPONSE_PAYLOAD)
     
-    # Test 1: Tools List
     print("Test 1: Requesting tools list...")
-    payload = {
-        "method": "tools/list",
-        "params": {},
-        "jsonrpc": "2.0",
-        "id": "test-1"
-    }
-    
     try:
-        response = lambda_client.invoke(
-            FunctionName=function_name,
-            InvocationType='RequestResponse',
-            Payload=json.dumps(payload)
-        )
-        
-        result = json.loads(response['Payload'].read())
+        result = tools_list.result()
         print("✅ Tools list request successful!")
-        print(f"Response: {json.dumps(result, indent=2)}")
+        if verbose:
+            print(f"Response: {json.dumps(result, indent=2)}")
         print()
         
     except Exception as e:
         print(f"❌ Tools list failed: {str(e)}")
         return False
     
-    # Test 2: Enhanced AI Response
     print("Test 2: Testing enhanced AI response...")
-    payload = {
-        "method": "tools/call",
-        "params": {
-            "name": "enhanced_ai_response",
-            "arguments": {
-                "question": "How do I reset my Thomson Reuters password?",
-                "session_id": "test-session-123"
-            }
-        },
-        "jsonrpc": "2.0",
-        "id": "test-2"
-    }
-    
     try:
-        response = lambda_client.invoke(
-            FunctionName=function_name,
-            InvocationType='RequestResponse',
-            Payload=json.dumps(payload)
-        )
-        
-        result = json.loads(response['Payload'].read())
+        result = ai_response.result()
         print("✅ Enhanced AI response successful!")
-        print(f"Response: {json.dumps(result, indent=2)}")
+        if verbose:
+            print(f"Response: {json.dumps(result, indent=2)}")
         print()
         
     except Exception as e:
@@ -76,4 +71,8 @@ def test_mcp_connection():
     return True
 
 if __name__ == "__main__":
-    test_mcp_connection()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Quick MCP server connectivity test")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print the full JSON responses")
+    args = parser.parse_args()
+    
+    test_mcp_connection(verbose=args.verbose)
\ No newline at end of file
@@ -4,86 +4,103 @@ Test TR URLs and Documentation Links
 Verify that the MCP server returns actual Thomson Reuters portal URLs
 """
 
+import argparse
 import json
-import boto3
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Tuple
+from mcp_client import invoke_mcp
 
-def test_tr_urls():
+class URLCheck(NamedTuple):
+    """A TR tool query and the URLs its response should contain"""
+    tool: str
+    query: str
+    expected_urls: Tuple[str, ...]
+
+# Test cases with expected TR URLs
+TEST_CASES = (
+    URLCheck(
+        tool="reset_password",
+        query="How do I reset my password?",
+        expected_urls=("https://myaccount.thomsonreuters.com", "+1-800-328-4880")
+    ),
+    URLCheck(
+        tool="cloud_tool_access",
+        query="How do I get cloud tool access?",
+        expected_urls=("https://tr.service-now.com", "+1-800-328-4880")
+    ),
+    URLCheck(
+        tool="aws_access",
+        query="How do I get AWS access?",
+        expected_urls=("https://tr.service-now.com", "+1-800-328-4880")
+    )
+)
+
+def test_tr_urls(verbose=False):
     """Test that TR tools return actual URLs and documentation"""
     print("🧪 Testing Thomson Reuters URLs and Documentation")
     print("=" * 60)
     
-    lambda_client = boto3.client('lambda', region_name='us-east-1')
-    function_name = "a208194-it-helpdesk-enhanced-mcp-server"
-    
-    # Test cases with expected TR URLs
-    test_cases = [
-        {
-            "tool": "reset_password",
-            "query": "How do I reset my password?",
-            "expected_urls": ["https://myaccount.thomsonreuters.com", "+1-800-328-4880"]
-        },
-        {
-            "tool": "cloud_tool_access", 
-            "query": "How do I get cloud tool access?",
-            "expected_urls": ["https://tr.service-now.com", "+1-800-328-4880"]
-        },
-        {
-            "tool": "aws_access",
-            "query": "How do I get AWS access?", 
-            "expected_urls": ["https://tr.service-now.com", "+1-800-328-4880"]
-        }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"Test {i}: {test_case['tool']}")
-        print("-" * 40)
-        
-        payload = {
+    # Serialize every payload up front so the worker threads only do I/O
+    payloads = [
+        json.dumps({
             "method": "tools/call",
             "params": {
-                "name": test_case["tool"],
+                "name": test_case.tool,
                 "arguments": {
-                    "query": test_case["query"],
+                    "query": test_case.query,
                     "session_id": f"test-session-{i}"
                 }
             },
             "jsonrpc": "2.0",
             "id": f"test-{i}"
-        }
+        }).encode('utf-8')
+        for i, test_case in enumerate(TEST_CASES, 1)
+    ]
+    
+    # The tool calls are independent and network-bound, so invoke them
+    # concurrently and report the results in test order
+    with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+        futures = [
+            executor.submit(invoke_mcp, payload)
+            for payload in payloads
+        ]
+    
+    for i, (test_case, future) in enumerate(zip(TEST_CASES, futures), 1):
+        # Collect each test's report and write it in one go
+        lines = [f"Test {i}: {test_case.tool}", "-" * 40]
         
         try:
-            response = lambda_client.invoke(
-                FunctionName=function_name,
-                InvocationType='RequestResponse',
-                Payload=json.dumps(payload)
-            )
-            
-            result = json.loads(response['Payload'].read())
+            result = future.result()
             
             if "result" in result and "content" in result["result"]:
                 content = result["result"]["content"][0]["text"]
-                print("✅ Response received:")
-                print(content)
-                print()
+                lines.append("✅ Response received")
+                if verbose:
+                    lines += [content, ""]
                 
                 # Check for expected URLs
                 found_urls = []
-                for expected_url in test_case["expected_urls"]:
+                for expected_url in test_case.expected_urls:
                     if expected_url in content:
                         found_urls.append(expected_url)
                 
                 if found_urls:
-                    print(f"✅ Found expected TR URLs: {', '.join(found_urls)}")
+                    lines.append(f"✅ Found expected TR URLs: {', '.join(found_urls)}")
                 else:
-                    print(f"❌ Missing expected TR URLs: {', '.join(test_case['expected_urls'])}")
+                    lines.append(f"❌ Missing expected TR URLs: {', '.join(test_case.expected_urls)}")
                 
             else:
-                print(f"❌ Invalid response format: {result}")
+                lines.append(f"❌ Invalid response format: {result}")
                 
         except Exception as e:
-            print(f"❌ Test failed: {str(e)}")
+            lines.append(f"❌ Test failed: {str(e)}")
         
-        print("\n" + "="*60 + "\n")
+        lines.append("\n" + "="*60 + "\n")
+        print("\n".join(lines))
 
 if __name__ == "__main__":
-    test_tr_urls()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Check that TR tools return portal URLs")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print the full tool responses")
+    args = parser.parse_args()
+    
+    test_tr_urls(verbose=args.verbose)
\ No newline at end of file